@@ -72,7 +72,7 @@ class LearningEventType(Enum):
     APPLICATION = "application"
     MASTERY = "mastery"
 
-@dataclass
+@dataclass(slots=True)
 class IntegrationResult:
     """
     Result structure for learning integration computation
@@ -154,6 +154,9 @@ class LearningIntegrationEngine:
         self.computation_times: List[float] = []
         self.memory_usage_history: List[float] = []
         
+        # Cached metrics snapshot keyed by the state it was computed from
+        self._performance_metrics_cache: Optional[Tuple[Tuple[int, int, int], Dict[str, Any]]] = None
+        
         # Initialize learning model managers
         self.learner_manager = LearnerModelManager()
         self.knowledge_manager = KnowledgeModelManager()
@@ -1008,7 +1011,9 @@ class LearningIntegrationEngine:
         performance requirements are maintained.
         
         Returns:
-            Dictionary containing performance metrics
+            Dictionary containing performance metrics. The snapshot is cached
+            and returned again until new computations or state changes
+            arrive, so callers must treat it as read-only.
         """
         try:
             if not self.computation_times:
@@ -1017,6 +1022,16 @@ class LearningIntegrationEngine:
                     "message": "No computation history available"
                 }
             
+            # Reuse the previous snapshot if nothing has been computed since
+            cache_key = (
+                len(self.computation_times),
+                len(self.current_states),
+                len(self.computation_history)
+            )
+            if (self._performance_metrics_cache is not None and
+                    self._performance_metrics_cache[0] == cache_key):
+                return self._performance_metrics_cache[1]
+            
             # Calculate performance statistics
             avg_computation_time = sum(self.computation_times) / len(self.computation_times)
             max_computation_time = max(self.computation_times)
@@ -1028,7 +1043,7 @@ class LearningIntegrationEngine:
                 if time <= self.MAX_COMPUTATION_TIME_MS
             ) / len(self.computation_times) * 100
             
-            return {
+            metrics = {
                 "computation_performance": {
                     "average_time_ms": round(avg_computation_time, 2),
                     "max_time_ms": round(max_computation_time, 2),
@@ -1048,6 +1063,9 @@ class LearningIntegrationEngine:
                 "learning_events_processed": self._get_learning_event_statistics()
             }
             
+            self._performance_metrics_cache = (cache_key, metrics)
+            return metrics
+            
         except Exception as e:
             self.logger.error(f"Performance metrics calculation failed: {e}")
             return {
@@ -1087,6 +1105,19 @@ class LearningIntegrationEngine:
         except Exception as e:
             self.logger.error(f"Failed to reset learner state: {e}")
     
+    def reset_metrics(self):
+        """
+        Clear computation timings and history (for testing or new sessions)
+        
+        Educational Impact:
+        Lets performance monitoring start from a clean baseline without
+        discarding any learner's transition state.
+        """
+        self.computation_history.clear()
+        self.computation_times.clear()
+        self.memory_usage_history.clear()
+        self._performance_metrics_cache = None
+    
     async def update_equation_parameters(self, alpha: Optional[float] = None, beta: Optional[float] = None):
         """
         Update learning equation parameters for system tuning
@@ -19,7 +19,7 @@ import logging
 import json
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable, Set
+from typing import Dict, List, Any, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import weakref
@@ -416,6 +416,7 @@ class RealTimeLearningPipeline:
         # Performance monitoring
         self.latency_measurements: List[float] = []
         self.throughput_measurements: List[int] = []
+        self._pipeline_metrics_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
         
         # Pipeline configuration
         self.max_concurrent_processors = 10
@@ -740,9 +741,25 @@ class RealTimeLearningPipeline:
         optimization and educational effectiveness monitoring.
         
         Returns:
-            Dictionary containing comprehensive pipeline metrics
+            Dictionary containing comprehensive pipeline metrics. The snapshot
+            is cached and returned again until event counters or the metrics
+            loop change it, so callers must treat it as read-only.
         """
-        return {
+        # Aggregates are refreshed by the metrics loop (last_updated) while
+        # counters move per event; reuse the snapshot until either changes
+        cache_key = (
+            self.metrics.last_updated,
+            self.metrics.events_processed,
+            self.metrics.successful_adaptations,
+            self.metrics.failed_adaptations,
+            self.metrics.missed_deadlines,
+            self.is_running,
+            len(self.processing_tasks)
+        )
+        if self._pipeline_metrics_cache is not None and self._pipeline_metrics_cache[0] == cache_key:
+            return self._pipeline_metrics_cache[1]
+        
+        metrics = {
             "performance_metrics": {
                 "events_processed": self.metrics.events_processed,
                 "average_latency_ms": round(self.metrics.average_latency_ms, 2),
@@ -766,6 +783,22 @@ class RealTimeLearningPipeline:
             },
             "timestamp": self.metrics.last_updated
         }
+        
+        self._pipeline_metrics_cache = (cache_key, metrics)
+        return metrics
+    
+    def reset_metrics(self):
+        """
+        Clear pipeline counters and latency samples (for testing or new sessions)
+        
+        Educational Impact:
+        Lets pipeline monitoring start from a clean baseline while workers
+        and registered adaptation callbacks keep running.
+        """
+        self.metrics = PipelineMetrics()
+        self.latency_measurements.clear()
+        self.throughput_measurements.clear()
+        self._pipeline_metrics_cache = None
     
     def _calculate_throughput(self) -> float:
         """Calculate events per second throughput"""
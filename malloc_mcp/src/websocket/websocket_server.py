@@ -66,7 +66,8 @@ class WebSocketServer:
         host: str = "localhost",
         port: int = 8765,
         security_manager: Optional[EducationalSecurityManager] = None,
-        integration_engine: Optional[LearningIntegrationEngine] = None
+        integration_engine: Optional[LearningIntegrationEngine] = None,
+        reuse_port: bool = False
     ):
         """
         Initialize WebSocket server for real-time learning adaptation.
@@ -81,9 +82,13 @@ class WebSocketServer:
             port: Server port for WebSocket connections  
             security_manager: FERPA-compliant security manager for learner data protection
             integration_engine: Learning integration engine for real-time adaptation
+            reuse_port: Bind with SO_REUSEPORT so several server instances (e.g.
+                one per core) can share the port, with the kernel spreading
+                accepts across their independent listen queues
         """
         self.host = host
         self.port = port
+        self.reuse_port = reuse_port
         self.security_manager = security_manager or EducationalSecurityManager()
         self.integration_engine = integration_engine or LearningIntegrationEngine()
         
@@ -138,7 +143,8 @@ class WebSocketServer:
                 ping_interval=20,  # Keep connections alive
                 ping_timeout=10,   # Connection timeout
                 max_size=10**6,    # 1MB max message size
-                compression=None   # Disable compression for low latency
+                compression=None,  # Disable compression for low latency
+                reuse_port=self.reuse_port  # Per-core listeners when enabled
             )
             
             self.is_running = True
@@ -249,46 +255,74 @@ class WebSocketServer:
         try:
             # Wait for connection message
             async for message in websocket:
-                start_time = time.time()
-                
                 try:
-                    # Parse message
-                    data = json.loads(message)
-                    action = data.get('action')
+                    parsed = json.loads(message)
+                except (ValueError, RecursionError):
+                    # JSONDecodeError, invalid UTF-8 in binary frames and
+                    # pathologically nested input all leave the session open
+                    await self._send_error_message(websocket, "invalid_json", "Invalid JSON format")
+                    continue
+                
+                # A JSON array is a client-side batch of messages, handled in
+                # order with one response each
+                if isinstance(parsed, list):
+                    if not parsed:
+                        await self._send_error_message(websocket, "empty_batch", "Message batch is empty")
+                        continue
+                    batch = parsed
+                else:
+                    batch = (parsed,)
+                disconnected = False
+                
+                for data in batch:
+                    start_time = time.time()
                     
-                    if action == 'connect':
-                        # Handle connection establishment
-                        session_id = await self._handle_connect(connection_id, websocket, data)
-                        
-                    elif action == 'learning_data':
-                        # Handle real-time learning data streaming
-                        await self._handle_learning_data(connection_id, websocket, data)
+                    try:
+                        if not isinstance(data, dict):
+                            await self._send_error_message(
+                                websocket,
+                                "invalid_message",
+                                "Message must be a JSON object"
+                            )
+                        else:
+                            action = data.get('action')
+                            
+                            if action == 'connect':
+                                # Handle connection establishment
+                                session_id = await self._handle_connect(connection_id, websocket, data)
+                                
+                            elif action == 'learning_data':
+                                # Handle real-time learning data streaming
+                                await self._handle_learning_data(connection_id, websocket, data)
+                                
+                            elif action == 'adaptation_request':
+                                # Handle explicit adaptation requests
+                                await self._handle_adaptation_request(connection_id, websocket, data)
+                                
+                            elif action == 'disconnect':
+                                # Handle graceful disconnection
+                                await self._handle_disconnect(connection_id, websocket, data)
+                                disconnected = True
+                                break
+                                
+                            else:
+                                await self._send_error_message(
+                                    websocket, 
+                                    "invalid_action", 
+                                    f"Unknown action: {action}"
+                                )
+                                
+                    except Exception as e:
+                        # One failing message must not drop the rest of its batch
+                        logger.error(f"Error processing message: {e}")
+                        await self._send_error_message(websocket, "processing_error", str(e))
                         
-                    elif action == 'adaptation_request':
-                        # Handle explicit adaptation requests
-                        await self._handle_adaptation_request(connection_id, websocket, data)
-                        
-                    elif action == 'disconnect':
-                        # Handle graceful disconnection
-                        await self._handle_disconnect(connection_id, websocket, data)
-                        break
-                        
-                    else:
-                        await self._send_error_message(
-                            websocket, 
-                            "invalid_action", 
-                            f"Unknown action: {action}"
-                        )
-                    
-                    # Update performance metrics
+                    # Update performance metrics per message, not per frame
                     processing_time = time.time() - start_time
                     self._update_performance_metrics(processing_time)
                     
-                except json.JSONDecodeError:
-                    await self._send_error_message(websocket, "invalid_json", "Invalid JSON format")
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
-                    await self._send_error_message(websocket, "processing_error", str(e))
+                if disconnected:
+                    break
                     
         except websockets.exceptions.ConnectionClosed:
             logger.info(f"Connection {connection_id} closed by client")
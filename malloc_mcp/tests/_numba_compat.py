@@ -0,0 +1,18 @@
+"""
+Numba compatibility shim for the test suite's numeric helpers
+
+Exposes numba's njit when it is installed, otherwise a no-op decorator
+that leaves the decorated function interpreted.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function interpreted"""
+        def decorator(func):
+            return func
+        return decorator
@@ -0,0 +1,145 @@
+"""
+Shared pytest configuration for the Malloc VR MCP test suite
+
+Runs the asyncio tests on uvloop when it is installed, falling back to the
+standard policy where it is unavailable (e.g. Windows).
+
+Long-running suites are split into xdist_group markers so they can run in
+parallel with `pytest -n 2 --dist=loadgroup` when pytest-xdist is installed.
+
+Performance tests can record their raw latency samples through the
+latency_artifact fixture (artifacts/<test>.parquet, or .csv without pyarrow)
+so distributions can be compared across runs.
+
+Pass --profile to record pyinstrument flame charts for tests that request
+the profiler fixture; the fixture is a no-op without the flag.
+"""
+
+import asyncio
+import logging
+import re
+
+import numpy as np
+import pytest
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    logging.info("uvloop not available - using default asyncio event loop")
+
+try:
+    from pyinstrument import Profiler
+    PYINSTRUMENT_AVAILABLE = True
+except ImportError:
+    PYINSTRUMENT_AVAILABLE = False
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False  # Windows has no RLIMIT_NOFILE
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def pytest_configure(config):
+    """Register markers from optional plugins so runs without them stay warning-free"""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run tests sharing a group on one pytest-xdist worker (--dist=loadgroup)"
+    )
+
+
+def pytest_addoption(parser):
+    """Register the opt-in profiling flag"""
+    parser.addoption(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Write pyinstrument HTML profiles for tests using the profiler fixture"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def open_file_limit():
+    """
+    Raise the soft open-file limit for the session
+    
+    Concurrent-connection tests hold dozens of sockets on both the client
+    and the in-process server; the common 1024 soft limit leaves little
+    headroom. The previous limit is restored afterwards.
+    """
+    if not RESOURCE_AVAILABLE:
+        yield None
+        return
+    
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = 65536 if hard == resource.RLIM_INFINITY else min(65536, hard)
+    if soft != resource.RLIM_INFINITY and soft < target:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError) as e:
+            logging.warning(f"Could not raise open file limit: {e}")
+    yield resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Event loop policy used by pytest-asyncio for every async test"""
+    if UVLOOP_AVAILABLE:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture
+def profiler(request):
+    """
+    Profile the requesting test with pyinstrument when --profile is given
+    
+    Writes prof_<test name>.html to the pytest root directory. Yields None
+    when profiling is off or pyinstrument is not installed.
+    """
+    if not request.config.getoption("--profile"):
+        yield None
+        return
+    if not PYINSTRUMENT_AVAILABLE:
+        logging.warning("pyinstrument not available - --profile ignored")
+        yield None
+        return
+    
+    test_profiler = Profiler(async_mode="enabled")
+    test_profiler.start()
+    yield test_profiler
+    test_profiler.stop()
+    test_profiler.write_html(str(request.config.rootpath / f"prof_{request.node.name}.html"))
+
+
+@pytest.fixture
+def latency_artifact(request):
+    """
+    Return a writer that saves raw per-iteration samples for the requesting test
+    
+    Each call writes one column of samples to artifacts/<test>[_<label>].parquet
+    under the pytest root (CSV when pyarrow is not installed). Aggregated
+    assertions stay in the tests; the artifacts are for offline analysis.
+    """
+    artifact_dir = request.config.rootpath / "artifacts"
+    test_name = re.sub(r"[^\w.-]", "_", request.node.name)
+    
+    def write(samples, column: str = "ms", label: str = ""):
+        artifact_dir.mkdir(exist_ok=True)
+        stem = f"{test_name}_{label}" if label else test_name
+        if PYARROW_AVAILABLE:
+            pq.write_table(pa.table({column: samples}), artifact_dir / f"{stem}.parquet")
+        else:
+            np.savetxt(artifact_dir / f"{stem}.csv", samples, header=column, comments="", delimiter=",")
+    
+    return write
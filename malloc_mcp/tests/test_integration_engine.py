@@ -17,7 +17,7 @@ import pytest
 import asyncio
 import time
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, List
 
 # Import integration engine and related components
@@ -27,6 +27,7 @@ from src.learning.integration_engine import (
     IntegrationResult,
     LearningEventType
 )
+from src.learning.real_time_pipeline import RealTimeLearningPipeline
 
 class TestLearningIntegrationEngine:
     """
@@ -544,6 +545,78 @@ class TestSystemMonitoringAndAnalytics:
         # Should be back to initial neutral state computation
         assert learner_id in integration_engine.current_states
 
+# Metric snapshot caching
+@pytest.mark.asyncio
+async def test_performance_metrics_snapshot_cache():
+    """
+    Test that engine metrics are reused until the underlying state changes
+    
+    Educational Impact:
+    Monitoring dashboards poll metrics frequently; cached snapshots must
+    still reflect every new computation and learner reset.
+    """
+    engine = LearningIntegrationEngine()
+    model_inputs = LearningModelInputs(
+        learner_model_data={"learner_model_weight": 0.30, "adaptation_parameters": {"alpha_baseline": 0.6}},
+        knowledge_model_data={"units_completed": 5, "total_units": 10, "prerequisite_satisfaction": 0.70},
+        engagement_model_data={"attention_level": 0.65, "interaction_quality": 0.60},
+        assessment_model_data={"competency_score": 0.65, "skill_demonstration": 0.60}
+    )
+    
+    for learner_id in ("cache_learner_a", "cache_learner_b"):
+        await engine.compute_transition_state(learner_id, model_inputs, "practice")
+    
+    first = await engine.get_performance_metrics()
+    assert await engine.get_performance_metrics() is first
+    
+    # A new computation invalidates the snapshot
+    await engine.compute_transition_state("cache_learner_a", model_inputs, "practice")
+    after_compute = await engine.get_performance_metrics()
+    assert after_compute is not first
+    assert after_compute["computation_performance"]["total_computations"] == 3
+    
+    # So does resetting a learner
+    await engine.reset_learner_state("cache_learner_b")
+    after_reset = await engine.get_performance_metrics()
+    assert after_reset is not after_compute
+    assert after_reset["memory_usage"]["current_states_count"] == 1
+    
+    # Clearing the metrics drops the snapshot entirely
+    engine.reset_metrics()
+    assert (await engine.get_performance_metrics())["status"] == "no_data"
+
+def test_pipeline_metrics_snapshot_cache():
+    """
+    Test that pipeline metrics are reused until counters or the metrics loop change
+    
+    Educational Impact:
+    Pipeline health checks must see every processed event and every
+    aggregate refresh even though repeated polls share one snapshot.
+    """
+    pipeline = RealTimeLearningPipeline(LearningIntegrationEngine())
+    
+    first = pipeline.get_pipeline_metrics()
+    assert pipeline.get_pipeline_metrics() is first
+    
+    # A processed event (as recorded by the workers) invalidates the snapshot
+    pipeline.metrics.events_processed += 1
+    pipeline.metrics.successful_adaptations += 1
+    after_event = pipeline.get_pipeline_metrics()
+    assert after_event is not first
+    assert after_event["performance_metrics"]["events_processed"] == 1
+    assert pipeline.get_pipeline_metrics() is after_event
+    
+    # So does a metrics loop refresh, which stamps last_updated
+    pipeline.metrics.average_latency_ms = 3.0
+    pipeline.metrics.last_updated = (datetime.now() + timedelta(seconds=5)).isoformat()
+    after_refresh = pipeline.get_pipeline_metrics()
+    assert after_refresh is not after_event
+    assert after_refresh["performance_metrics"]["average_latency_ms"] == 3.0
+    
+    # Clearing the metrics starts over from zero
+    pipeline.reset_metrics()
+    assert pipeline.get_pipeline_metrics()["performance_metrics"]["events_processed"] == 0
+
 # Integration test for full system functionality
 @pytest.mark.asyncio
 async def test_full_integration_scenario():